@@ -30,11 +30,14 @@
 """
 AutoTulipAgent variant; uses a vector store as a tool library, has CRUD access to the library.
 """
+import ast
 import json
 import logging
+import os
 from typing import Optional
 
 from tulip_agent.constants import BASE_LANGUAGE_MODEL, BASE_TEMPERATURE
+from tulip_agent.fast_json import loads as _loads
 from tulip_agent.prompts import (
     AUTO_TULIP_PROMPT,
     TASK_DECOMPOSITION,
@@ -50,7 +53,102 @@ from .tulip_agent import TulipAgent
 logger = logging.getLogger(__name__)
 
 
+# static tool schemas, built once and shared read-only across agent instances
+CREATE_TOOL_DESCRIPTION = {
+    "type": "function",
+    "function": {
+        "name": "create_tool",
+        "description": "Generate a tool and add it to your tool library.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "task_description": {
+                    "type": "string",
+                    "description": "A textual description of the task to be solved with a Python function.",
+                },
+            },
+            "required": ["task_description"],
+            "additionalProperties": False,
+        },
+        "strict": True,
+    },
+}
+UPDATE_TOOL_DESCRIPTION = {
+    "type": "function",
+    "function": {
+        "name": "update_tool",
+        "description": "Update a tool in your tool library.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "tool_name": {
+                    "type": "string",
+                    "description": "The tool's unique name, as returned by the tool search.",
+                },
+                "instruction": {
+                    "type": "string",
+                    "description": "A textual description of the changes to be made to the tool.",
+                },
+            },
+            "required": ["tool_name", "instruction"],
+            "additionalProperties": False,
+        },
+        "strict": True,
+    },
+}
+DELETE_TOOL_DESCRIPTION = {
+    "type": "function",
+    "function": {
+        "name": "delete_tool",
+        "description": (
+            "Delete a tool from your tool library. "
+            "You may have to look up the exact name using the search_tools tool."
+        ),
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "tool_name": {
+                    "type": "string",
+                    "description": "The tool's unique name, as returned by the tool search.",
+                },
+            },
+            "required": ["tool_name"],
+            "additionalProperties": False,
+        },
+        "strict": True,
+    },
+}
+DECOMPOSE_TASK_DESCRIPTION = {
+    "type": "function",
+    "function": {
+        "name": "decompose_task",
+        "description": "Decompose a task into its subtasks.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "task": {
+                    "type": "string",
+                    "description": "A description of the task that should be decomposed into steps.",
+                },
+            },
+            "required": ["task"],
+            "additionalProperties": False,
+        },
+        "strict": True,
+    },
+}
+
+
 class AutoTulipAgent(TulipAgent):
+    __slots__ = (
+        "create_tool_description",
+        "update_tool_description",
+        "delete_tool_description",
+        "decompose_task_description",
+        "base_tools",
+        "tools",
+    )
+
     def __init__(
         self,
         model: str = BASE_LANGUAGE_MODEL,
@@ -61,6 +159,10 @@ class AutoTulipAgent(TulipAgent):
         top_k_functions: int = 1,
         search_similarity_threshold: float = None,
         instructions: Optional[str] = None,
+        prefetch_tools: bool = False,
+        parallel_search: bool = True,
+        token_budget: Optional[int] = None,
+        summarize_dropped: bool = False,
     ) -> None:
         super().__init__(
             instructions=(
@@ -75,89 +177,23 @@ class AutoTulipAgent(TulipAgent):
             tool_library=tool_library,
             top_k_functions=top_k_functions,
             search_similarity_threshold=search_similarity_threshold,
+            prefetch_tools=prefetch_tools,
+            parallel_search=parallel_search,
+            token_budget=token_budget,
+            summarize_dropped=summarize_dropped,
         )
-        self.create_tool_description = {
-            "type": "function",
-            "function": {
-                "name": "create_tool",
-                "description": "Generate a tool and add it to your tool library.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "task_description": {
-                            "type": "string",
-                            "description": "A textual description of the task to be solved with a Python function.",
-                        },
-                    },
-                    "required": ["task_description"],
-                },
-            },
-        }
-        self.update_tool_description = {
-            "type": "function",
-            "function": {
-                "name": "update_tool",
-                "description": "Update a tool in your tool library.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "tool_name": {
-                            "type": "string",
-                            "description": "The tool's unique name, as returned by the tool search.",
-                        },
-                        "instruction": {
-                            "type": "string",
-                            "description": "A textual description of the changes to be made to the tool.",
-                        },
-                    },
-                    "required": ["tool_name", "instruction"],
-                },
-            },
-        }
-        self.delete_tool_description = {
-            "type": "function",
-            "function": {
-                "name": "delete_tool",
-                "description": (
-                    "Delete a tool from your tool library. "
-                    "You may have to look up the exact name using the search_tools tool."
-                ),
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "tool_name": {
-                            "type": "string",
-                            "description": "The tool's unique name, as returned by the tool search.",
-                        },
-                    },
-                    "required": ["tool_name"],
-                },
-            },
-        }
-        self.decompose_task_description = {
-            "type": "function",
-            "function": {
-                "name": "decompose_task",
-                "description": "Decompose a task into its subtasks.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "task": {
-                            "type": "string",
-                            "description": "A description of the task that should be decomposed into steps.",
-                        },
-                    },
-                    "required": ["task"],
-                },
-            },
-        }
-        self.tools = [
+        self.create_tool_description = CREATE_TOOL_DESCRIPTION
+        self.update_tool_description = UPDATE_TOOL_DESCRIPTION
+        self.delete_tool_description = DELETE_TOOL_DESCRIPTION
+        self.decompose_task_description = DECOMPOSE_TASK_DESCRIPTION
+        self.base_tools = [
             self.search_tools_description,
             self.create_tool_description,
             self.update_tool_description,
             self.delete_tool_description,
             self.decompose_task_description,
         ]
+        self.tools = list(self.base_tools)
 
     def create_tool(self, task_description: str) -> str:
         # gen code
@@ -169,16 +205,30 @@ class AutoTulipAgent(TulipAgent):
             )
             logger.info(failure_msg)
             return failure_msg
-        # write to file
-        function_name = code.split("def ")[1].split("(")[0]
+        # write to file; the AST handles decorators, nested defs, and
+        # "def" appearing in strings, which naive string splitting does not
+        function_defs = [
+            node for node in ast.parse(code).body if isinstance(node, ast.FunctionDef)
+        ]
+        if not function_defs:
+            failure_msg = (
+                f"Failed generating a function for the task `{task_description}`."
+            )
+            logger.info(failure_msg)
+            return failure_msg
+        function_name = function_defs[-1].name
         module_name = f"{function_name}_module"
-        with open(f"{module_name}.py", "w") as f:
+        # write atomically so a failure cannot leave a half-written module
+        # that the tool library would then try to import
+        with open(f"{module_name}.py.tmp", "w") as f:
             f.write(code)
+        os.replace(f"{module_name}.py.tmp", f"{module_name}.py")
         # add module to tool library
         new_tool = self.tool_library.load_functions_from_file(
             module_name=module_name, function_names=[f"{function_name}"]
         )[0]
         self.tools.append(new_tool.definition)
+        self._invalidate_search_cache()
         success_msg = f"Made tool `{module_name}__{function_name}` available via the tool library."
         logger.info(success_msg)
         return success_msg
@@ -199,9 +249,10 @@ class AutoTulipAgent(TulipAgent):
         # reload tool library
         with open(module_path, "w") as m:
             m.write(code)
-        updated_tool_description = self.tool_library.update_tool(tool_id=tool_name)
+        updated_tool = self.tool_library.update_tool(tool_id=tool_name)
         self.tools = [t for t in self.tools if t["function"]["name"] != tool_name]
-        self.tools.append(updated_tool_description)
+        self.tools.append(updated_tool.definition)
+        self._invalidate_search_cache()
         success_msg = f"Successfully updated `{tool_name}`."
         logger.info(success_msg)
         return success_msg
@@ -209,6 +260,7 @@ class AutoTulipAgent(TulipAgent):
     def delete_tool(self, tool_name: str) -> str:
         self.tool_library.remove_tool(tool_id=tool_name)
         self.tools = [t for t in self.tools if t["function"]["name"] != tool_name]
+        self._invalidate_search_cache()
         return f"Removed tool {tool_name} from the tool library."
 
     def decompose_task(self, task: str) -> str:
@@ -232,6 +284,9 @@ class AutoTulipAgent(TulipAgent):
         prompt: str,
     ) -> str:
         logger.info(f"{self.__class__.__name__} received query: {prompt}")
+        # start each query from the base schemas; tools discovered for one
+        # query would otherwise inflate the payload of every later one
+        self.tools = list(self.base_tools)
         self.messages.append(
             {
                 "role": "user",
@@ -260,7 +315,7 @@ class AutoTulipAgent(TulipAgent):
             for tool_call in tool_calls:
                 func_name = tool_call.function.name
                 try:
-                    func_args = json.loads(tool_call.function.arguments)
+                    func_args = _loads(tool_call.function.arguments)
                 except json.decoder.JSONDecodeError as e:
                     logger.error(e)
                     generated_func_name = func_name
@@ -310,17 +365,18 @@ class AutoTulipAgent(TulipAgent):
                     )
                 elif func_name == "search_tools":
                     logger.info(f"Tool search for: {str(func_args)}")
-                    new_tools = [
-                        tool
-                        for partial in self.search_tools(
-                            **func_args,
-                            similarity_threshold=self.search_similarity_threshold,
-                        )
-                        for tool in partial[1]
-                        if tool not in self.tools
-                    ]
+                    known_names = {t["function"]["name"] for t in self.tools}
+                    new_tools = []
+                    for _, found_tools in self.search_tools(
+                        **func_args,
+                        similarity_threshold=self.search_similarity_threshold,
+                    ):
+                        for tool in found_tools:
+                            if tool.unique_id not in known_names:
+                                known_names.add(tool.unique_id)
+                                new_tools.append(tool)
                     logger.info(f"Tools found: {str(new_tools)}")
-                    self.tools.extend(new_tools)
+                    self.tools.extend(tool.definition for tool in new_tools)
                     tool_names_ = [new_tool.unique_id for new_tool in new_tools]
                     if tool_names_:
                         status = f"Successfully provided suitable tools: {tool_names_}."
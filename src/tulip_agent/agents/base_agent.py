@@ -43,12 +43,16 @@ logger = logging.getLogger(__name__)
 
 
 class BaseAgent(LlmAgent):
+    __slots__ = ()
+
     def __init__(
         self,
         instructions: Optional[str] = None,
         model: str = BASE_LANGUAGE_MODEL,
         temperature: float = BASE_TEMPERATURE,
         model_serve_mode: ModelServeMode = ModelServeMode.OPENAI,
+        token_budget: Optional[int] = None,
+        summarize_dropped: bool = False,
     ) -> None:
         super().__init__(
             instructions=(
@@ -57,6 +61,8 @@ class BaseAgent(LlmAgent):
             model=model,
             temperature=temperature,
             model_serve_mode=model_serve_mode,
+            token_budget=token_budget,
+            summarize_dropped=summarize_dropped,
         )
 
     def query(
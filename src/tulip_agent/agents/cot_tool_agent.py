@@ -44,6 +44,8 @@ logger = logging.getLogger(__name__)
 
 
 class CotToolAgent(ToolAgent):
+    __slots__ = ()
+
     def __init__(
         self,
         functions: list[Callable],
@@ -52,6 +54,8 @@ class CotToolAgent(ToolAgent):
         temperature: float = BASE_TEMPERATURE,
         model_serve_mode: ModelServeMode = ModelServeMode.OPENAI,
         api_interaction_limit: int = 100,
+        token_budget: Optional[int] = None,
+        summarize_dropped: bool = False,
     ) -> None:
         super().__init__(
             instructions=(
@@ -64,6 +68,8 @@ class CotToolAgent(ToolAgent):
             temperature=temperature,
             model_serve_mode=model_serve_mode,
             api_interaction_limit=api_interaction_limit,
+            token_budget=token_budget,
+            summarize_dropped=summarize_dropped,
         )
 
     def query(
@@ -30,7 +30,6 @@
 """
 CotTulipAgent variant; uses a vector store as a tool library and COT for task decomposition.
 """
-import json
 import logging
 from typing import Optional
 
@@ -39,6 +38,7 @@ from openai.types.chat.chat_completion_message_tool_call import (
 )
 
 from tulip_agent.constants import BASE_LANGUAGE_MODEL, BASE_TEMPERATURE
+from tulip_agent.fast_json import loads as _loads
 from tulip_agent.prompts import (
     RECURSIVE_TASK_DECOMPOSITION,
     SOLVE_WITH_TOOLS,
@@ -55,6 +55,8 @@ logger = logging.getLogger(__name__)
 
 
 class CotTulipAgent(TulipAgent):
+    __slots__ = ("decomposition_prompt",)
+
     def __init__(
         self,
         model: str = BASE_LANGUAGE_MODEL,
@@ -66,6 +68,10 @@ class CotTulipAgent(TulipAgent):
         search_similarity_threshold: float = None,
         instructions: Optional[str] = None,
         decomposition_prompt: str = RECURSIVE_TASK_DECOMPOSITION,
+        prefetch_tools: bool = False,
+        parallel_search: bool = True,
+        token_budget: Optional[int] = None,
+        summarize_dropped: bool = False,
     ) -> None:
         super().__init__(
             instructions=(
@@ -80,44 +86,48 @@ class CotTulipAgent(TulipAgent):
             tool_library=tool_library,
             top_k_functions=top_k_functions,
             search_similarity_threshold=search_similarity_threshold,
+            prefetch_tools=prefetch_tools,
+            parallel_search=parallel_search,
+            token_budget=token_budget,
+            summarize_dropped=summarize_dropped,
         )
         self.decomposition_prompt = decomposition_prompt
 
     def recursively_search_tool(
         self,
-        tool_call: ChatCompletionMessageToolCall,
+        tool_calls: list[ChatCompletionMessageToolCall],
         depth: int,
         max_depth: int = 2,
     ) -> tuple[list, list]:
-        new_tools, new_tasks = [], []
-        tools_by_tasks = self.execute_search_tool_call(
-            tool_call=tool_call, track_history=True
-        )
-        for task, tools in tools_by_tasks:
-            if not tools and depth < max_depth:
-                subtasks = self.decompose_task(
-                    task=task,
-                    base_prompt=self.decomposition_prompt,
-                )
-                subtask_str = ""
-                for c, subtask in enumerate(subtasks):
-                    subtask_str += f"{str(c+1)}. {subtask}"
-                tool_call = self.get_search_tool_call(tasks=subtask_str)
-                tools_, tasks_ = self.recursively_search_tool(
-                    tool_call=tool_call,
-                    depth=depth + 1,
-                    max_depth=max_depth,
+        new_tools_by_id, new_tasks = {}, []
+        # explicit queue instead of recursion: tasks are expanded level by
+        # level, and tools are deduplicated by id in a single dict
+        frontier = [(tool_call, depth) for tool_call in tool_calls]
+        while frontier:
+            next_frontier = []
+            for tool_call_, depth_ in frontier:
+                tools_by_tasks = self.execute_search_tool_call(
+                    tool_call=tool_call_, track_history=True
                 )
-                for t in tools_:
-                    if t not in new_tools:
-                        new_tools.append(t)
-                new_tasks.append(tasks_)
-            else:
-                for t in tools:
-                    if t not in new_tools:
-                        new_tools.append(t)
-                new_tasks.append(task)
-        return new_tools, new_tasks
+                for task, tools in tools_by_tasks:
+                    if not tools and depth_ < max_depth:
+                        subtasks = self.decompose_task(
+                            task=task,
+                            base_prompt=self.decomposition_prompt,
+                        )
+                        subtask_str = "".join(
+                            f"{c + 1}. {subtask}" for c, subtask in enumerate(subtasks)
+                        )
+                        next_frontier.extend(
+                            (tc, depth_ + 1)
+                            for tc in self.get_search_tool_calls(tasks=subtask_str)
+                        )
+                    else:
+                        for t in tools:
+                            new_tools_by_id.setdefault(t.unique_id, t)
+                        new_tasks.append(task)
+            frontier = next_frontier
+        return list(new_tools_by_id.values()), new_tasks
 
     def decompose_task(
         self,
@@ -136,10 +146,10 @@ class CotTulipAgent(TulipAgent):
         actions_response_message = actions_response.choices[0].message
         self.messages.append(actions_response_message)
         logger.info(f"{actions_response_message=}")
-        res = json.loads(actions_response_message.content)
+        res = _loads(actions_response_message.content)
         return res["subtasks"]
 
-    def get_search_tool_call(self, tasks: str):
+    def get_search_tool_calls(self, tasks: str) -> list[ChatCompletionMessageToolCall]:
         self.messages.append(
             {
                 "role": "user",
@@ -154,10 +164,7 @@ class CotTulipAgent(TulipAgent):
         response_message = function_response.choices[0].message
         tool_calls = response_message.tool_calls
         self.messages.append(response_message)
-        assert (
-            lntc := len(tool_calls)
-        ) == 1, f"Not exactly one tool search executed, but {lntc}."
-        return tool_calls[0]
+        return tool_calls
 
     def query(
         self,
@@ -167,15 +174,13 @@ class CotTulipAgent(TulipAgent):
 
         # Get tasks from user input and initiate recursive tool search
         tasks = self.decompose_task(task=prompt, base_prompt=self.decomposition_prompt)
-        tool_call = self.get_search_tool_call(tasks)
+        tool_calls = self.get_search_tool_calls(tasks)
         tools, general_tasks = self.recursively_search_tool(
-            tool_call=tool_call, depth=0
+            tool_calls=tool_calls, depth=0
         )
 
         # Run with tools
-        task_str = ""
-        for c, task in enumerate(tasks):
-            task_str += f"{str(c+1)}. {task}\n"
+        task_str = "".join(f"{c + 1}. {task}\n" for c, task in enumerate(tasks))
         logger.info(f"{task_str=}")
         self.messages.append(
             {
@@ -31,11 +31,11 @@
 DfsTulipAgent variant; uses a vector store as a tool library and does DFS style planning.
 """
 import copy
-import json
 import logging
 from typing import Optional
 
 from tulip_agent.constants import BASE_LANGUAGE_MODEL, BASE_TEMPERATURE
+from tulip_agent.fast_json import loads as _loads
 from tulip_agent.prompts import (
     TOOL_CREATE,
     TREE_TULIP_AGGREGATE_PROMPT,
@@ -57,6 +57,14 @@ logger = logging.getLogger(__name__)
 
 
 class DfsTulipAgent(TulipAgent):
+    __slots__ = (
+        "max_recursion_depth",
+        "max_paraphrases",
+        "max_replans",
+        "plot_task_tree",
+        "task",
+    )
+
     def __init__(
         self,
         model: str = BASE_LANGUAGE_MODEL,
@@ -71,6 +79,10 @@ class DfsTulipAgent(TulipAgent):
         max_replans: int = 1,
         instructions: Optional[str] = None,
         plot_task_tree: bool = False,
+        prefetch_tools: bool = False,
+        parallel_search: bool = True,
+        token_budget: Optional[int] = None,
+        summarize_dropped: bool = False,
     ) -> None:
         super().__init__(
             instructions=(
@@ -85,6 +97,10 @@ class DfsTulipAgent(TulipAgent):
             tool_library=tool_library,
             top_k_functions=top_k_functions,
             search_similarity_threshold=search_similarity_threshold,
+            prefetch_tools=prefetch_tools,
+            parallel_search=parallel_search,
+            token_budget=token_budget,
+            summarize_dropped=summarize_dropped,
         )
         self.max_recursion_depth = max_recursion_depth
         self.max_paraphrases = max_paraphrases
@@ -133,7 +149,7 @@ class DfsTulipAgent(TulipAgent):
         response = self._get_response(msgs=messages, response_format="json")
         decompose_response_message = response.choices[0].message
         logger.info(f"{decompose_response_message=}")
-        res = json.loads(decompose_response_message.content)
+        res = _loads(decompose_response_message.content)
         return res["subtasks"]
 
     def create_tool(self, task_description: str) -> None | Tool:
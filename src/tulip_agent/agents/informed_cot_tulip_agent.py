@@ -46,6 +46,8 @@ logger = logging.getLogger(__name__)
 
 
 class InformedCotTulipAgent(CotTulipAgent):
+    __slots__ = ()
+
     def __init__(
         self,
         model: str = BASE_LANGUAGE_MODEL,
@@ -57,6 +59,10 @@ class InformedCotTulipAgent(CotTulipAgent):
         search_similarity_threshold: float = None,
         instructions: Optional[str] = None,
         decomposition_prompt: str = INFORMED_TASK_DECOMPOSITION,
+        prefetch_tools: bool = False,
+        parallel_search: bool = True,
+        token_budget: Optional[int] = None,
+        summarize_dropped: bool = False,
     ) -> None:
         super().__init__(
             instructions=(
@@ -71,6 +77,10 @@ class InformedCotTulipAgent(CotTulipAgent):
             tool_library=tool_library,
             top_k_functions=top_k_functions,
             search_similarity_threshold=search_similarity_threshold,
+            prefetch_tools=prefetch_tools,
+            parallel_search=parallel_search,
+            token_budget=token_budget,
+            summarize_dropped=summarize_dropped,
             decomposition_prompt=decomposition_prompt.replace(
                 "{library_description}",
                 tool_library.description if tool_library.description else "",
@@ -30,22 +30,68 @@
 """
 LLM agent ABC.
 """
+import asyncio
 import logging
+import random
 import time
 from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Optional
 
+import tiktoken
 from openai import BadRequestError, OpenAIError
 from openai.types.chat.chat_completion import ChatCompletion, Choice
 from openai.types.chat.chat_completion_message import ChatCompletionMessage
 
 from tulip_agent.client_setup import ModelServeMode, create_client
 from tulip_agent.constants import BASE_LANGUAGE_MODEL, BASE_TEMPERATURE
+from tulip_agent.prompts import CONVERSATION_SUMMARY
 
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _encoding_for_model(model: str) -> tiktoken.Encoding:
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def _message_text(message) -> str:
+    """Text content of a message, including tool-call arguments."""
+    if isinstance(message, dict):
+        return message.get("content") or ""
+    text = message.content or ""
+    for tool_call in message.tool_calls or []:
+        text += tool_call.function.name + tool_call.function.arguments
+    return text
+
+
+def _message_tokens(message, encoding: tiktoken.Encoding) -> int:
+    """Approximate token count of a message."""
+    # constant offset for the per-message framing tokens
+    return len(encoding.encode(_message_text(message))) + 4
+
+
 class LlmAgent(ABC):
+    # agents are plain attribute bags created in large numbers during
+    # evaluations; slots drop the per-instance __dict__
+    __slots__ = (
+        "model",
+        "token_budget",
+        "temperature",
+        "instructions",
+        "llm_client",
+        "messages",
+        "api_interaction_limit",
+        "api_interaction_counter",
+        "max_retries",
+        "summarize_dropped",
+        "_rolling_summary",
+    )
+
     def __init__(
         self,
         instructions: str,
@@ -53,8 +99,17 @@ class LlmAgent(ABC):
         temperature: float = BASE_TEMPERATURE,
         model_serve_mode: ModelServeMode = ModelServeMode.OPENAI,
         api_interaction_limit: int = 100,
+        token_budget: Optional[int] = None,
+        summarize_dropped: bool = False,
     ) -> None:
         self.model = model
+        # when set, older non-system messages are left out of requests once
+        # the conversation exceeds this approximate prompt-token count
+        self.token_budget = token_budget
+        # when trimming, optionally carry a rolling summary of the dropped
+        # messages instead of losing their content entirely
+        self.summarize_dropped = summarize_dropped
+        self._rolling_summary = ""
         self.temperature = temperature
         self.instructions = instructions
         self.llm_client = create_client(model_serve_mode)
@@ -77,18 +132,20 @@ class LlmAgent(ABC):
         response_format: str = None,
     ):
         self.api_interaction_counter += 1
+        if self.token_budget:
+            msgs = self._trim_messages(msgs)
+        params = {
+            "model": model if model else self.model,
+            "messages": msgs,
+            "temperature": temperature if temperature else self.temperature,
+        }
+        if tools:
+            params["tools"] = tools
+            params["tool_choice"] = tool_choice
+        if response_format == "json":
+            params["response_format"] = {"type": "json_object"}
         response, retries = None, 0
         while not response:
-            params = {
-                "model": model if model else self.model,
-                "messages": msgs,
-                "temperature": temperature if temperature else self.temperature,
-            }
-            if tools:
-                params["tools"] = tools
-                params["tool_choice"] = tool_choice
-            if response_format == "json":
-                params["response_format"] = {"type": "json_object"}
             try:
                 response = self.llm_client.chat.completions.create(**params)
             # Return error message for bad requests, e.g., repetitive inputs or context window exceeded
@@ -112,15 +169,116 @@ class LlmAgent(ABC):
             except OpenAIError as e:
                 logger.error(f"{type(e).__name__}: {e}")
                 retries += 1
-                time.sleep(retries / 4)
                 if retries >= self.max_retries:
                     raise e
+                # capped exponential backoff with jitter; a tight retry loop
+                # only provokes further rate-limit errors
+                delay = min(2**retries, 30) * random.uniform(0.5, 1.0)
+                retry_after = getattr(getattr(e, "response", None), "headers", {}).get(
+                    "retry-after"
+                )
+                if retry_after:
+                    try:
+                        delay = float(retry_after)
+                    except ValueError:
+                        pass
+                time.sleep(delay)
         logger.info(
             f"Usage for {response.id} in tokens: "
             f"{response.usage.prompt_tokens} prompt and {response.usage.completion_tokens} completion."
         )
         return response
 
+    def _trim_messages(self, msgs: list) -> list:
+        """
+        Return a sliding window over the conversation that fits the token
+        budget: the system message and the most recent messages are kept,
+        the oldest ones are dropped. The stored history is left untouched.
+        """
+        encoding = _encoding_for_model(self.model)
+        counts = [_message_tokens(message, encoding) for message in msgs]
+        total = sum(counts)
+        if total <= self.token_budget:
+            return msgs
+        start = (
+            1
+            if msgs and isinstance(msgs[0], dict) and msgs[0].get("role") == "system"
+            else 0
+        )
+        index = start
+        while total > self.token_budget and index < len(msgs) - 1:
+            total -= counts[index]
+            index += 1
+        # a tool result must not appear without its originating tool call
+        while (
+            index < len(msgs) - 1
+            and isinstance(msgs[index], dict)
+            and msgs[index].get("role") == "tool"
+        ):
+            total -= counts[index]
+            index += 1
+        if isinstance(msgs[index], dict) and msgs[index].get("role") == "tool":
+            # the conversation ends in tool results; keep the whole block
+            # including its tool-call message, even over budget, since a
+            # partial exchange is rejected by the API
+            while (
+                index > start
+                and isinstance(msgs[index - 1], dict)
+                and msgs[index - 1].get("role") == "tool"
+            ):
+                index -= 1
+                total += counts[index]
+            previous = msgs[index - 1] if index > start else None
+            if previous is not None and (
+                previous.get("tool_calls")
+                if isinstance(previous, dict)
+                else previous.tool_calls
+            ):
+                index -= 1
+                total += counts[index]
+        logger.info(
+            f"Trimmed conversation to ~{total} prompt tokens by dropping "
+            f"{index - start} of {len(msgs) - start} non-system messages."
+        )
+        if self.summarize_dropped and index > start:
+            self._update_rolling_summary(msgs[start:index])
+            if self._rolling_summary:
+                summary_message = {
+                    "role": "system",
+                    "content": f"Summary of earlier turns: {self._rolling_summary}",
+                }
+                return msgs[:start] + [summary_message] + msgs[index:]
+        return msgs[:start] + msgs[index:]
+
+    def _update_rolling_summary(self, dropped: list) -> None:
+        """
+        Fold messages dropped by trimming into a rolling summary; on API
+        errors the previous summary is kept rather than failing the query.
+        """
+        excerpt = "\n".join(
+            text for message in dropped if (text := _message_text(message))
+        )
+        if not excerpt:
+            return
+        self.api_interaction_counter += 1
+        try:
+            response = self.llm_client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": CONVERSATION_SUMMARY.format(
+                            summary=self._rolling_summary or "None",
+                            excerpt=excerpt,
+                        ),
+                    }
+                ],
+                temperature=self.temperature,
+            )
+            self._rolling_summary = response.choices[0].message.content or ""
+        except OpenAIError as e:
+            logger.warning(f"Could not summarize dropped messages: {e}")
+
     @abstractmethod
     def query(
         self,
@@ -133,3 +291,16 @@ class LlmAgent(ABC):
         :return: User-oriented final response
         """
         pass
+
+    async def aquery(
+        self,
+        prompt: str,
+    ) -> str:
+        """
+        Query the agent from async code; the blocking client calls run in a
+        worker thread so the caller's event loop is not stalled.
+
+        :param prompt: User prompt
+        :return: User-oriented final response
+        """
+        return await asyncio.to_thread(self.query, prompt)
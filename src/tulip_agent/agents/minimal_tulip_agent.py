@@ -45,6 +45,8 @@ logger = logging.getLogger(__name__)
 
 
 class MinimalTulipAgent(TulipAgent):
+    __slots__ = ()
+
     def __init__(
         self,
         model: str = BASE_LANGUAGE_MODEL,
@@ -55,6 +57,10 @@ class MinimalTulipAgent(TulipAgent):
         top_k_functions: int = 10,
         search_similarity_threshold: float = None,
         instructions: Optional[str] = None,
+        prefetch_tools: bool = False,
+        parallel_search: bool = True,
+        token_budget: Optional[int] = None,
+        summarize_dropped: bool = False,
     ) -> None:
         super().__init__(
             instructions=(
@@ -67,6 +73,10 @@ class MinimalTulipAgent(TulipAgent):
             tool_library=tool_library,
             top_k_functions=top_k_functions,
             search_similarity_threshold=search_similarity_threshold,
+            prefetch_tools=prefetch_tools,
+            parallel_search=parallel_search,
+            token_budget=token_budget,
+            summarize_dropped=summarize_dropped,
         )
 
     def query(
@@ -43,6 +43,8 @@ logger = logging.getLogger(__name__)
 
 
 class NaiveToolAgent(ToolAgent):
+    __slots__ = ()
+
     def __init__(
         self,
         functions: list[Callable],
@@ -50,6 +52,8 @@ class NaiveToolAgent(ToolAgent):
         model: str = BASE_LANGUAGE_MODEL,
         temperature: float = BASE_TEMPERATURE,
         api_interaction_limit: int = 100,
+        token_budget: Optional[int] = None,
+        summarize_dropped: bool = False,
     ) -> None:
         super().__init__(
             functions=functions,
@@ -59,6 +63,8 @@ class NaiveToolAgent(ToolAgent):
             model=model,
             temperature=temperature,
             api_interaction_limit=api_interaction_limit,
+            token_budget=token_budget,
+            summarize_dropped=summarize_dropped,
         )
 
     def query(
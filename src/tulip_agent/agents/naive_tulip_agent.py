@@ -45,6 +45,8 @@ logger = logging.getLogger(__name__)
 
 
 class NaiveTulipAgent(TulipAgent):
+    __slots__ = ()
+
     def __init__(
         self,
         model: str = BASE_LANGUAGE_MODEL,
@@ -55,6 +57,10 @@ class NaiveTulipAgent(TulipAgent):
         top_k_functions: int = 3,
         search_similarity_threshold: float = None,
         instructions: Optional[str] = None,
+        prefetch_tools: bool = False,
+        parallel_search: bool = True,
+        token_budget: Optional[int] = None,
+        summarize_dropped: bool = False,
     ) -> None:
         super().__init__(
             instructions=(
@@ -67,6 +73,10 @@ class NaiveTulipAgent(TulipAgent):
             tool_library=tool_library,
             top_k_functions=top_k_functions,
             search_similarity_threshold=search_similarity_threshold,
+            prefetch_tools=prefetch_tools,
+            parallel_search=parallel_search,
+            token_budget=token_budget,
+            summarize_dropped=summarize_dropped,
         )
 
     def query(
@@ -98,45 +108,38 @@ class NaiveTulipAgent(TulipAgent):
             _msgs.append(response_message)
             tool_calls = response_message.tool_calls
 
-            # More than one tool call - several searches should be combined in one call
-            if (lntc := len(tool_calls)) > 1:
-                logger.info(
-                    f"Tool search invalid: Returned {lntc} instead of 1 search call. Retrying."
-                )
+            # Run the searches; several search calls are combined into one
+            # deduplicated tool list instead of triggering another model call
+            try:
+                seen_ids, tools_found = set(), []
                 for tool_call in tool_calls:
-                    _msgs.append(
-                        {
-                            "tool_call_id": tool_call.id,
-                            "role": "tool",
-                            "name": "search_tools",
-                            "content": "Error: Invalid number of tool calls; return a single call to `search_tools`.",
-                        }
-                    )
-            # Try running search for tools from tool call
-            else:
-                try:
                     tools_ = self.execute_search_tool_call(
-                        tool_call=tool_calls[0], track_history=False
+                        tool_call=tool_call, track_history=False
                     )
-                    tools = [tool for partial in tools_ for tool in partial[1]]
-                    if tools:
-                        break
-                    else:
+                    for _, partial in tools_:
+                        for tool in partial:
+                            if tool.unique_id not in seen_ids:
+                                seen_ids.add(tool.unique_id)
+                                tools_found.append(tool)
+                if tools_found:
+                    tools = tools_found
+                    break
+                else:
+                    for tool_call in tool_calls:
                         _msgs.append(
                             {
-                                "tool_call_id": tool_calls[0].id,
+                                "tool_call_id": tool_call.id,
                                 "role": "tool",
                                 "name": "search_tools",
                                 "content": "Did not find any tools. Retry by paraphrasing.",
                             }
                         )
-                except Exception as e:
-                    logger.info(
-                        f"Invalid tool call for `search_tools`: `{e}`. Retrying."
-                    )
+            except Exception as e:
+                logger.info(f"Invalid tool call for `search_tools`: `{e}`. Retrying.")
+                for tool_call in tool_calls:
                     _msgs.append(
                         {
-                            "tool_call_id": tool_calls[0].id,
+                            "tool_call_id": tool_call.id,
                             "role": "tool",
                             "name": "search_tools",
                             "content": f"Error: Invalid tool call for `search_tools`: {e}",
@@ -46,6 +46,8 @@ logger = logging.getLogger(__name__)
 
 
 class OneShotCotTulipAgent(CotTulipAgent):
+    __slots__ = ()
+
     def __init__(
         self,
         model: str = BASE_LANGUAGE_MODEL,
@@ -56,6 +58,10 @@ class OneShotCotTulipAgent(CotTulipAgent):
         top_k_functions: int = 3,
         search_similarity_threshold: float = None,
         instructions: Optional[str] = None,
+        prefetch_tools: bool = False,
+        parallel_search: bool = True,
+        token_budget: Optional[int] = None,
+        summarize_dropped: bool = False,
     ) -> None:
         super().__init__(
             instructions=(
@@ -70,4 +76,8 @@ class OneShotCotTulipAgent(CotTulipAgent):
             tool_library=tool_library,
             top_k_functions=top_k_functions,
             search_similarity_threshold=search_similarity_threshold,
+            prefetch_tools=prefetch_tools,
+            parallel_search=parallel_search,
+            token_budget=token_budget,
+            summarize_dropped=summarize_dropped,
         )
@@ -51,6 +51,8 @@ logger = logging.getLogger(__name__)
 
 
 class PrimedCotTulipAgent(CotTulipAgent):
+    __slots__ = ("decomposition_prompt_raw", "priming_top_k")
+
     def __init__(
         self,
         model: str = BASE_LANGUAGE_MODEL,
@@ -63,6 +65,10 @@ class PrimedCotTulipAgent(CotTulipAgent):
         instructions: Optional[str] = None,
         decomposition_prompt: str = PRIMED_TASK_DECOMPOSITION,
         priming_top_k: int = 25,
+        prefetch_tools: bool = False,
+        parallel_search: bool = True,
+        token_budget: Optional[int] = None,
+        summarize_dropped: bool = False,
     ) -> None:
         super().__init__(
             instructions=(
@@ -78,6 +84,10 @@ class PrimedCotTulipAgent(CotTulipAgent):
             top_k_functions=top_k_functions,
             search_similarity_threshold=search_similarity_threshold,
             decomposition_prompt=decomposition_prompt,
+            prefetch_tools=prefetch_tools,
+            parallel_search=parallel_search,
+            token_budget=token_budget,
+            summarize_dropped=summarize_dropped,
         )
         self.priming_top_k = priming_top_k
         self.decomposition_prompt_raw = copy.copy(decomposition_prompt)
@@ -103,15 +113,13 @@ class PrimedCotTulipAgent(CotTulipAgent):
 
         # Task decomposition w priming
         tasks = self.decompose_task(task=prompt, base_prompt=self.decomposition_prompt)
-        tool_call = self.get_search_tool_call(tasks)
+        tool_calls = self.get_search_tool_calls(tasks)
         tools, general_tasks = self.recursively_search_tool(
-            tool_call=tool_call, depth=0
+            tool_calls=tool_calls, depth=0
         )
 
         # Run with tools
-        task_str = ""
-        for c, task in enumerate(tasks):
-            task_str += f"{str(c+1)}. {task}\n"
+        task_str = "".join(f"{c + 1}. {task}\n" for c, task in enumerate(tasks))
         logger.info(f"{task_str=}")
         self.messages.append(
             {
@@ -34,10 +34,12 @@ import concurrent.futures
 import json
 import logging
 from abc import ABC
-from typing import Callable
+from types import MappingProxyType
+from typing import Callable, Optional
 
 from tulip_agent.constants import BASE_LANGUAGE_MODEL, BASE_TEMPERATURE
-from tulip_agent.function_analyzer import FunctionAnalyzer
+from tulip_agent.fast_json import loads as _loads
+from tulip_agent.function_analyzer import FUNCTION_ANALYZER
 
 from .base_agent import LlmAgent, ModelServeMode
 
@@ -46,6 +48,14 @@ logger = logging.getLogger(__name__)
 
 
 class ToolAgent(LlmAgent, ABC):
+    __slots__ = (
+        "function_analyzer",
+        "tools",
+        "tool_descriptions",
+        "tool_timeout",
+        "tool_timeout_message",
+    )
+
     def __init__(
         self,
         functions: list[Callable],
@@ -54,6 +64,8 @@ class ToolAgent(LlmAgent, ABC):
         temperature: float = BASE_TEMPERATURE,
         model_serve_mode: ModelServeMode = ModelServeMode.OPENAI,
         api_interaction_limit: int = 100,
+        token_budget: Optional[int] = None,
+        summarize_dropped: bool = False,
     ) -> None:
         super().__init__(
             instructions=instructions,
@@ -61,9 +73,12 @@ class ToolAgent(LlmAgent, ABC):
             temperature=temperature,
             model_serve_mode=model_serve_mode,
             api_interaction_limit=api_interaction_limit,
+            token_budget=token_budget,
+            summarize_dropped=summarize_dropped,
         )
-        self.function_analyzer = FunctionAnalyzer()
-        self.tools = {f.__name__: f for f in functions}
+        self.function_analyzer = FUNCTION_ANALYZER
+        # the tool set is immutable after init; freeze it to make that explicit
+        self.tools = MappingProxyType({f.__name__: f for f in functions})
         self.tool_descriptions = [
             self.function_analyzer.analyze_function(f) for f in functions
         ]
@@ -96,7 +111,7 @@ class ToolAgent(LlmAgent, ABC):
 
                 with concurrent.futures.ThreadPoolExecutor() as executor:
                     try:
-                        func_args = json.loads(tool_call.function.arguments)
+                        func_args = _loads(tool_call.function.arguments)
                         future = executor.submit(self.tools[func_name], **func_args)
                         function_response = future.result(timeout=self.tool_timeout)
                     except json.decoder.JSONDecodeError as e:
@@ -31,11 +31,14 @@
 TulipAgent ABC; uses a vector store as a tool library.
 """
 import ast
+import concurrent.futures
 import json
 import logging
 import os
 import subprocess
+import threading
 from abc import ABC
+from collections import OrderedDict
 from typing import Optional
 
 from openai.types.chat.chat_completion_message_tool_call import (
@@ -43,6 +46,7 @@ from openai.types.chat.chat_completion_message_tool_call import (
 )
 
 from tulip_agent.constants import BASE_LANGUAGE_MODEL, BASE_TEMPERATURE
+from tulip_agent.fast_json import loads as _loads
 from tulip_agent.prompts import TECH_LEAD
 from tulip_agent.tool import Tool
 from tulip_agent.tool_library import ToolLibrary
@@ -53,7 +57,48 @@ from .base_agent import LlmAgent, ModelServeMode
 logger = logging.getLogger(__name__)
 
 
+# recurring subtasks re-enter search across queries; bound the cache regardless
+SEARCH_CACHE_SIZE = 256
+
+# static tool schemas, built once and shared read-only across agent instances
+SEARCH_TOOLS_DESCRIPTION = {
+    "type": "function",
+    "function": {
+        "name": "search_tools",
+        "description": "Search for tools in your tool library.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "action_descriptions": {
+                    "type": "array",
+                    "items": {
+                        "type": "string",
+                    },
+                    "description": (
+                        "A list of strings with textual descriptions for the actions you want to execute. "
+                        "The description should be generic enough to find generic and reusable tools."
+                    ),
+                },
+            },
+            "required": ["action_descriptions"],
+            "additionalProperties": False,
+        },
+        "strict": True,
+    },
+}
+
+
 class TulipAgent(LlmAgent, ABC):
+    __slots__ = (
+        "tool_library",
+        "top_k_functions",
+        "search_similarity_threshold",
+        "prefetch_tools",
+        "parallel_search",
+        "_search_cache",
+        "search_tools_description",
+    )
+
     def __init__(
         self,
         instructions: str,
@@ -64,6 +109,10 @@ class TulipAgent(LlmAgent, ABC):
         tool_library: ToolLibrary = None,
         top_k_functions: int = 3,
         search_similarity_threshold: float = None,
+        prefetch_tools: bool = False,
+        parallel_search: bool = True,
+        token_budget: Optional[int] = None,
+        summarize_dropped: bool = False,
     ) -> None:
         super().__init__(
             instructions=instructions,
@@ -71,60 +120,83 @@ class TulipAgent(LlmAgent, ABC):
             temperature=temperature,
             model_serve_mode=model_serve_mode,
             api_interaction_limit=api_interaction_limit,
+            token_budget=token_budget,
+            summarize_dropped=summarize_dropped,
         )
         self.tool_library = tool_library
         self.top_k_functions = top_k_functions
         self.search_similarity_threshold = search_similarity_threshold
+        self.prefetch_tools = prefetch_tools
+        self.parallel_search = parallel_search
+        self._search_cache: OrderedDict[tuple, list[Tool]] = OrderedDict()
 
-        self.search_tools_description = {
-            "type": "function",
-            "function": {
-                "name": "search_tools",
-                "description": "Search for tools in your tool library.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "action_descriptions": {
-                            "type": "array",
-                            "items": {
-                                "type": "string",
-                            },
-                            "description": (
-                                "A list of strings with textual descriptions for the actions you want to execute. "
-                                "The description should be generic enough to find generic and reusable tools."
-                            ),
-                        },
-                    },
-                    "required": ["action_descriptions"],
-                },
-            },
-        }
+        self.search_tools_description = SEARCH_TOOLS_DESCRIPTION
 
     def search_tools(
         self,
         action_descriptions: list[str],
         similarity_threshold: Optional[float] = None,
     ) -> list[tuple[str, list[Tool]]]:
-        """Find suitable tools for each action description."""
-        tool_lookup = {}
-        actions_with_tools = []
-        for action_description in action_descriptions:
-            if action_description in tool_lookup:
-                actions_with_tools.append(
-                    (action_description, tool_lookup[action_description])
-                )
+        """
+        Find suitable tools for each action description; unique descriptions
+        that miss the cache are embedded and searched in a single batched
+        vector-store query instead of one round-trip each.
+        """
+        tool_lookup: dict[str, list[Tool]] = {}
+        # descriptions that only differ in whitespace share one search; the
+        # cache is keyed by the normalized text for the same reason
+        pending: dict[str, list[str]] = {}
+        for description in dict.fromkeys(action_descriptions):
+            # recursive steps may already name a concrete tool; resolve those
+            # directly instead of embedding and searching
+            tool = self.tool_library.tools.get(description)
+            if tool is not None:
+                tool_lookup[description] = [tool]
                 continue
-            tools = self.tool_library.search(
-                problem_description=action_description,
-                top_k=self.top_k_functions,
-                similarity_threshold=similarity_threshold,
-            )
+            normalized = " ".join(description.split())
+            key = (normalized, self.top_k_functions, similarity_threshold)
+            tools = self._search_cache.get(key)
+            if tools is not None:
+                self._search_cache.move_to_end(key)
+                tool_lookup[description] = tools
+            else:
+                pending.setdefault(normalized, []).append(description)
+        if pending:
+            queries = list(pending)
+            if self.parallel_search or len(queries) == 1:
+                search_results = self.tool_library.search_many(
+                    problem_descriptions=queries,
+                    top_k=self.top_k_functions,
+                    similarity_threshold=similarity_threshold,
+                )
+            else:
+                search_results = [
+                    self.tool_library.search(
+                        problem_description=query,
+                        top_k=self.top_k_functions,
+                        similarity_threshold=similarity_threshold,
+                    )
+                    for query in queries
+                ]
+            for normalized, tools in zip(queries, search_results):
+                key = (normalized, self.top_k_functions, similarity_threshold)
+                self._search_cache[key] = tools
+                if len(self._search_cache) > SEARCH_CACHE_SIZE:
+                    self._search_cache.popitem(last=False)
+                for description in pending[normalized]:
+                    tool_lookup[description] = tools
+        for description, tools in tool_lookup.items():
             logger.info(
-                f"Functions for `{action_description}`: {[tool.unique_id for tool in tools]} "
+                f"Functions for `{description}`: {[tool.unique_id for tool in tools]} "
             )
-            tool_lookup[action_description] = tools
-            actions_with_tools.append((action_description, tools))
-        return actions_with_tools
+        return [
+            (action_description, tool_lookup[action_description])
+            for action_description in action_descriptions
+        ]
+
+    def _invalidate_search_cache(self) -> None:
+        """Drop cached search results, e.g., after the tool library changed."""
+        self._search_cache.clear()
 
     def execute_search_tool_call(
         self,
@@ -132,7 +204,7 @@ class TulipAgent(LlmAgent, ABC):
         track_history: bool,
     ) -> list[tuple[str, list]]:
         func = tool_call.function.name
-        args = json.loads(tool_call.function.arguments)
+        args = _loads(tool_call.function.arguments)
         assert func == "search_tools", f"Unexpected tool call: {func}"
 
         # search tulip for function with args
@@ -153,6 +225,23 @@ class TulipAgent(LlmAgent, ABC):
             )
         return tasks_and_tools
 
+    def _prefetch_tool_search(self, hint: str) -> None:
+        """
+        Warm the tool library caches with a fire-and-forget background search;
+        overlaps the lookup for a likely next step with the caller's idle time.
+        """
+
+        def _search() -> None:
+            try:
+                self.tool_library.search(
+                    problem_description=hint,
+                    top_k=self.top_k_functions,
+                )
+            except Exception as e:
+                logger.debug(f"Tool prefetch failed: {type(e).__name__}: {e}")
+
+        threading.Thread(target=_search, daemon=True).start()
+
     def run_with_tools(
         self,
         tools: list[Tool],
@@ -177,10 +266,10 @@ class TulipAgent(LlmAgent, ABC):
                 logger.warning(f"{self.__class__.__name__}: {error_message}")
                 return error_message
 
-            for tool_call in tool_calls:
+            def _execute_tool_call(tool_call) -> tuple[str, str]:
                 func_name = tool_call.function.name
                 try:
-                    func_args = json.loads(tool_call.function.arguments)
+                    func_args = _loads(tool_call.function.arguments)
                     function_response, error = self.tool_library.execute(
                         tool_id=func_name, arguments=func_args
                     )
@@ -198,17 +287,29 @@ class TulipAgent(LlmAgent, ABC):
                         f"Error: Invalid arguments for {func_name} "
                         f"(previously {generated_func_name}): {e}"
                     )
+                return func_name, str(function_response)
+
+            # independent tool calls from one assistant turn run concurrently;
+            # results are appended in call order, as the API requires
+            if len(tool_calls) > 1:
+                with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=min(len(tool_calls), 8)
+                ) as executor:
+                    results = list(executor.map(_execute_tool_call, tool_calls))
+            else:
+                results = [_execute_tool_call(tool_calls[0])]
+            for tool_call, (func_name, function_response) in zip(tool_calls, results):
                 messages.append(
                     {
                         "tool_call_id": tool_call.id,
                         "role": "tool",
                         "name": func_name,
-                        "content": str(function_response),
+                        "content": function_response,
                     }
                 )
                 logger.info(
                     (
-                        f"Function {func_name} returned `{str(function_response)}` "
+                        f"Function {func_name} returned `{function_response}` "
                         f"for arguments {tool_call.function.arguments}."
                     )
                 )
@@ -221,6 +322,8 @@ class TulipAgent(LlmAgent, ABC):
             response_message = response.choices[0].message
             tool_calls = response_message.tool_calls
         messages.append(response_message)
+        if self.prefetch_tools and response_message.content:
+            self._prefetch_tool_search(hint=response_message.content)
         return response_message.content
 
     @staticmethod
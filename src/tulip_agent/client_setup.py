@@ -30,6 +30,7 @@
 import logging
 import os
 from enum import Enum
+from functools import lru_cache
 
 from openai import AzureOpenAI, OpenAI
 
@@ -48,7 +49,13 @@ def check_for_environment_variable(env_var: str) -> None:
         raise ValueError(f"{env_var} not set.")
 
 
+@lru_cache(maxsize=None)
 def create_client(model_serve_mode: ModelServeMode) -> AzureOpenAI | OpenAI:
+    """
+    Create the client for a serve mode; one client per mode is shared across
+    all agents and tool libraries so they reuse a single HTTP connection pool
+    instead of opening separate sockets and TLS sessions each.
+    """
     match model_serve_mode:
         case ModelServeMode.OPENAI:
             check_for_environment_variable("OPENAI_API_KEY")
@@ -29,6 +29,7 @@
 #
 import logging
 
+import numpy as np
 from openai import AzureOpenAI, OpenAI
 
 from .constants import BASE_EMBEDDING_MODEL
@@ -49,3 +50,37 @@ def embed(
         f"Usage for embedding in tokens: {response.usage.prompt_tokens} prompt."
     )
     return response.data[0].embedding
+
+
+def embed_batch(
+    texts: list[str],
+    embedding_client: OpenAI | AzureOpenAI,
+    embedding_model: str = BASE_EMBEDDING_MODEL,
+) -> list[list[float]]:
+    """
+    Embed several texts with a single API call; much faster than one call per text.
+
+    :param texts: Texts to embed.
+    :param embedding_client: Client for the embedding backend.
+    :param embedding_model: Name of the embedding model used.
+    :return: One embedding per text, in input order.
+    """
+    response = embedding_client.embeddings.create(
+        model=embedding_model, input=texts, encoding_format="float"
+    )
+    logger.info(
+        f"Usage for embedding in tokens: {response.usage.prompt_tokens} prompt."
+    )
+    return [d.embedding for d in sorted(response.data, key=lambda d: d.index)]
+
+
+def quantize_embedding(embedding: list[float] | np.ndarray) -> np.ndarray:
+    """
+    Round one or several embeddings to float16 precision, which suffices for
+    similarity ranking. The result is returned as float32, so this emulates
+    quantized vectors without shrinking what the vector store persists.
+
+    :param embedding: Embedding vector, or matrix of embedding vectors.
+    :return: The embedding(s) rounded to float16 precision, as float32.
+    """
+    return np.asarray(embedding, dtype=np.float16).astype(np.float32)
@@ -34,19 +34,36 @@ for creating descriptions usable with the OpenAI API
 Note: Function calling w structured outputs is limited to a subset of the JSON schema language
 https://platform.openai.com/docs/guides/function-calling
 """
+import copy
+
 import pydantic
 
 
 class FunctionAnalyzer:
 
-    @staticmethod
-    def analyze_function(function_) -> dict:
+    # shared across instances; keyed by identity and bytecode so edited
+    # functions are reanalyzed while unchanged ones hit the cache
+    _cache: dict = {}
+
+    @classmethod
+    def analyze_function(cls, function_) -> dict:
         """
         Analyzes a python function and returns a description compatible with the OpenAI API
         Assumptions:
         * docstring includes a function description and parameter descriptions separated by 2 linebreaks
         * docstring includes parameter descriptions indicated by :param x:
         """
+        cache_key = (
+            function_.__module__,
+            function_.__qualname__,
+            function_.__code__.co_code,
+            function_.__doc__,
+        )
+        cached = cls._cache.get(cache_key)
+        if cached is not None:
+            # copy, as callers may rename the function in the description
+            return copy.deepcopy(cached)
+
         name = function_.__name__
 
         # analyze type hints
@@ -66,7 +83,7 @@ class FunctionAnalyzer:
         for parameter, parameter_description in parameter_descriptions.items():
             parameters["properties"][parameter]["description"] = parameter_description
 
-        return {
+        result = {
             "type": "function",
             "function": {
                 "name": name,
@@ -75,6 +92,8 @@ class FunctionAnalyzer:
             },
             "strict": True,
         }
+        cls._cache[cache_key] = copy.deepcopy(result)
+        return result
 
     def analyze_class(self, class_: object) -> list:
         """
@@ -87,3 +106,7 @@ class FunctionAnalyzer:
             if callable(getattr(class_, func)) and not func.startswith("_")
         ]
         return functions
+
+
+# Shared stateless instance; avoids creating one analyzer per agent or tool library
+FUNCTION_ANALYZER = FunctionAnalyzer()
@@ -258,3 +258,15 @@ Code:
 Instruction:
 {instruction}
 """
+
+
+CONVERSATION_SUMMARY = """\
+Summarize the following conversation excerpt in a few sentences.
+Retain facts, decisions, and results that later turns may rely on.
+
+Previous summary:
+{summary}
+
+Conversation excerpt:
+{excerpt}
+"""
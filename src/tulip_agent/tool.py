@@ -31,7 +31,6 @@ from __future__ import annotations
 
 import concurrent.futures
 import importlib
-import json
 import logging
 import os
 import sys
@@ -75,7 +74,8 @@ class Tool:
 
     def format_for_chroma(self) -> dict:
         flat_dict = asdict(self)
-        flat_dict["definition"] = json.dumps(self.definition, indent=4)
+        # the definition is already stored as the collection document
+        flat_dict.pop("definition")
         if self.predecessor is None:
             flat_dict.pop("predecessor")
         if self.successor is None:
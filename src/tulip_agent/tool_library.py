@@ -30,27 +30,159 @@
 """
 The tool library (tulip) for the agent
 """
+import hashlib
 import importlib
-import json
 import logging
+import sqlite3
 import sys
-from inspect import getmembers, isfunction
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from os.path import abspath, dirname
 from pathlib import Path
+from types import FunctionType, ModuleType
 from typing import Callable, Optional
 
 import chromadb
+import numpy as np
 
 from tulip_agent.client_setup import ModelServeMode, create_client
 from tulip_agent.constants import BASE_EMBEDDING_MODEL
-from tulip_agent.embed import embed
-from tulip_agent.function_analyzer import FunctionAnalyzer
+from tulip_agent.embed import embed_batch, quantize_embedding
+from tulip_agent.fast_json import dumps as _dumps
+from tulip_agent.fast_json import loads as _loads
+from tulip_agent.function_analyzer import FUNCTION_ANALYZER
 from tulip_agent.tool import Tool
 
 
 logger = logging.getLogger(__name__)
 
 
+# analyzing functions in parallel only pays off for larger modules
+PARALLEL_ANALYSIS_THRESHOLD = 8
+
+# agents frequently retry or loop over the same search queries
+QUERY_EMBEDDING_CACHE_SIZE = 1024
+
+# bound on cached results for tools registered as pure functions
+EXECUTION_CACHE_SIZE = 1024
+
+
+def _module_functions(
+    module: ModuleType,
+    module_name: str,
+    function_names: Optional[list[str]] = None,
+) -> list[Callable]:
+    """
+    Collect the functions a module defines itself; a single dict walk over
+    vars(module) avoids the per-attribute getattr calls of inspect.getmembers.
+    """
+    function_names_ = set(function_names) if function_names else None
+    return [
+        f
+        for n, f in vars(module).items()
+        if isinstance(f, FunctionType)
+        and f.__module__ == module_name
+        and (function_names_ is None or n in function_names_)
+    ]
+
+
+def _cached_import(module_name: str):
+    """Return an already-loaded module from sys.modules, importing it only once."""
+    module = sys.modules.get(module_name)
+    return module if module is not None else importlib.import_module(module_name)
+
+
+def _analyze_function(module_and_function_name: tuple[str, str]) -> dict:
+    """Analyze a single function in a worker process; the module is re-imported there."""
+    module_name, function_name = module_and_function_name
+    module = importlib.import_module(module_name)
+    return FUNCTION_ANALYZER.analyze_function(getattr(module, function_name))
+
+
+class _EmbedCache:
+    """
+    Content-addressed embedding cache backed by SQLite; keyed by a hash over
+    embedding model and text so unchanged tool descriptions are never re-embedded.
+    """
+
+    def __init__(self, path: str, model: str) -> None:
+        self.model = model
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (hash BLOB PRIMARY KEY, vec BLOB)"
+        )
+        self.connection.commit()
+
+    def _key(self, text: str) -> bytes:
+        return hashlib.sha256(f"{self.model}\n{text}".encode()).digest()
+
+    def get_many(self, texts: list[str]) -> dict[str, list[float]]:
+        if not texts:
+            return {}
+        keys = {text: self._key(text) for text in texts}
+        placeholders = ",".join("?" * len(keys))
+        with self.lock:
+            rows = self.connection.execute(
+                f"SELECT hash, vec FROM embeddings WHERE hash IN ({placeholders})",
+                list(keys.values()),
+            ).fetchall()
+        vecs = {h: np.frombuffer(v, dtype=np.float32) for h, v in rows}
+        return {text: vecs[key] for text, key in keys.items() if key in vecs}
+
+    def put_many(self, embeddings: dict[str, list[float]]) -> None:
+        with self.lock:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO embeddings VALUES (?, ?)",
+                [
+                    (self._key(text), np.asarray(vec, dtype=np.float32).tobytes())
+                    for text, vec in embeddings.items()
+                ],
+            )
+            self.connection.commit()
+
+
+class _ExactIndex:
+    """
+    Exact in-memory nearest-neighbor index over tool description embeddings.
+    For the few hundred tools a library typically holds, a brute-force matrix
+    product beats approximate graph search and returns exact results.
+    """
+
+    def __init__(self) -> None:
+        self.ids: list[str] = []
+        self.vectors: Optional[np.ndarray] = None
+
+    def add(self, ids: list[str], vectors: np.ndarray) -> None:
+        if not ids:
+            return
+        self.ids.extend(ids)
+        self.vectors = (
+            vectors if self.vectors is None else np.vstack((self.vectors, vectors))
+        )
+
+    def remove(self, id_: str) -> None:
+        if id_ not in self.ids:
+            return
+        index = self.ids.index(id_)
+        self.ids.pop(index)
+        self.vectors = np.delete(self.vectors, index, axis=0)
+
+    def update(self, id_: str, vector: np.ndarray) -> None:
+        self.vectors[self.ids.index(id_)] = vector
+
+    def query(self, vector: np.ndarray, top_k: int) -> tuple[list[str], list[float]]:
+        """Return the ids and squared L2 distances of the top_k closest entries."""
+        if not self.ids:
+            return [], []
+        deltas = self.vectors - vector
+        distances = np.einsum("ij,ij->i", deltas, deltas)
+        order = np.argsort(distances)[: min(top_k, len(self.ids))]
+        return [self.ids[i] for i in order], distances[order].tolist()
+
+
 class ToolLibrary:
     def __init__(
         self,
@@ -66,6 +198,10 @@ class ToolLibrary:
             "Error: The tool did not return a response within the specified timeout."
         ),
         timeout_settings: Optional[dict] = None,
+        quantize_embeddings: bool = False,
+        chroma_client: Optional[chromadb.ClientAPI] = None,
+        exact_search: bool = False,
+        memoized_tools: Optional[list[str]] = None,
     ) -> None:
         """
         Initialize the tool library: set up the vector store and load the tool information.
@@ -82,13 +218,30 @@ class ToolLibrary:
         :param timeout_settings: Tool-specific timeout settings of the form
             {"module_name__tool_name": {"timeout": seconds, "timeout_message": string}}
             NOTE: overriding existing timeout settings is not supported
+        :param quantize_embeddings: Round embeddings to float16 precision before storing them;
+            the stored vectors stay float32-sized, so this only trades precision, not space.
+        :param chroma_client: Optional preconfigured Chroma client, e.g., a chromadb.HttpClient
+            pointed at a long-lived server so writes do not reload the store in-process.
+            Defaults to a PersistentClient for the library folder.
+        :param exact_search: Serve search queries from an exact in-memory index over the
+            description embeddings instead of the approximate Chroma index; faster and
+            exact for libraries up to a few thousand tools. Chroma remains the store of record.
+        :param memoized_tools: Ids of tools that are pure functions; repeat executions
+            with identical arguments return the cached result instead of running again.
         """
         self.description = description
         self.embedding_model = embedding_model
         self.embedding_client = create_client(model_serve_mode)
+        self.quantize_embeddings = quantize_embeddings
 
-        self.function_analyzer = FunctionAnalyzer()
+        self.function_analyzer = FUNCTION_ANALYZER
         self.tools: dict[str, Tool] = {}
+        self._query_embedding_cache: OrderedDict[str, list[float]] = OrderedDict()
+        self.memoized_tools = set(memoized_tools) if memoized_tools else set()
+        self._execution_cache: OrderedDict[tuple, tuple] = OrderedDict()
+        # guards both LRU caches; they are reached from tool executor threads
+        # and the agents' prefetch thread
+        self._cache_lock = threading.Lock()
 
         # timeout settings
         self.default_timeout = default_timeout
@@ -98,46 +251,34 @@ class ToolLibrary:
         # set up directory
         chroma_dir = chroma_base_dir + chroma_sub_dir
         Path(chroma_dir).mkdir(parents=True, exist_ok=True)
+        self.embed_cache = _EmbedCache(
+            path=str(Path(chroma_dir) / "embed_cache.sqlite"),
+            model=embedding_model,
+        )
 
-        # vector store
-        self.chroma_client = chromadb.PersistentClient(path=chroma_dir)
-        self.collection = self.chroma_client.get_or_create_collection(name="tulip")
-        stored_tools = self.collection.get(include=["metadatas"])
-        stored_tools_ids = stored_tools["ids"]
-
-        # load functions available in vector store
-        for metadata in stored_tools["metadatas"]:
-            tool = Tool(
-                function_name=metadata["function_name"],
-                module_name=metadata["module_name"],
-                definition=json.loads(metadata["definition"]),
-                timeout=metadata["timeout"],
-                timeout_message=metadata["timeout_message"],
-                predecessor=(
-                    metadata["predecessor"] if "predecessor" in metadata else None
-                ),
-                successor=metadata["successor"] if "successor" in metadata else None,
-            )
-            self.tools[tool.unique_id] = tool
+        # vector store; creation and synchronization are deferred to first use,
+        # so callers that only execute freshly imported tools by id skip the
+        # Chroma warmup entirely
+        self._chroma_dir = chroma_dir
+        self._provided_chroma_client = chroma_client
+        self._chroma_client: Optional[chromadb.ClientAPI] = None
+        self._collection: Optional[chromadb.Collection] = None
+        self._store_lock = threading.Lock()
+        self._index = _ExactIndex() if exact_search else None
 
         # load tools from files
         if not file_imports:
             return
         for file_import in file_imports:
             module_name, function_names = file_import
-            module = importlib.import_module(module_name)
-            functions = [
-                f
-                for n, f in getmembers(module, isfunction)
-                if f.__module__ == module_name
-                and (not function_names or n in function_names)
-            ]
-            for function in functions:
-                function_definition = self.function_analyzer.analyze_function(function)
+            module = _cached_import(module_name)
+            functions = _module_functions(module, module_name, function_names)
+            definitions = self._analyze_functions(module_name, functions)
+            for function, definition in zip(functions, definitions):
                 tool = Tool(
                     function_name=function.__name__,
                     module_name=module_name,
-                    definition=function_definition,
+                    definition=definition,
                     timeout=self.default_timeout,
                     timeout_message=self.default_timeout_message,
                 )
@@ -148,40 +289,157 @@ class ToolLibrary:
                     ]
                 self.tools[tool.unique_id] = tool
 
-        # load new functions into vector store
-        new_tools = {
-            tool_id: tool
-            for tool_id, tool in self.tools.items()
-            if tool_id not in stored_tools_ids
-        }
-        if not new_tools:
-            return
-        logger.info(f"Adding new tools to vector store: {new_tools.keys()}")
-        self.collection.add(
-            documents=[
-                json.dumps(tool.definition, indent=4) for tool in new_tools.values()
-            ],
-            embeddings=[
-                embed(
-                    text=tool.description,
-                    embedding_client=self.embedding_client,
-                    embedding_model=self.embedding_model,
+    @property
+    def collection(self) -> chromadb.Collection:
+        """The Chroma collection, created and synchronized on first access."""
+        self._ensure_store_loaded()
+        return self._collection
+
+    @property
+    def chroma_client(self) -> chromadb.ClientAPI:
+        """The Chroma client, created on first access."""
+        self._ensure_store_loaded()
+        return self._chroma_client
+
+    def _ensure_store_loaded(self) -> None:
+        """Load the store exactly once, even with concurrent searches."""
+        if self._collection is None:
+            with self._store_lock:
+                if self._collection is None:
+                    self._load_store()
+
+    def _load_store(self) -> None:
+        """
+        Open the vector store, load the tools it holds, and push any freshly
+        imported tools that are not stored yet.
+        """
+        self._chroma_client = (
+            self._provided_chroma_client
+            if self._provided_chroma_client is not None
+            else chromadb.PersistentClient(path=self._chroma_dir)
+        )
+        self._collection = self._chroma_client.get_or_create_collection(name="tulip")
+        stored_ids = self._collection.get(include=[])["ids"]
+        if self._index is not None and stored_ids:
+            stored_embeddings = self._collection.get(
+                ids=stored_ids, include=["embeddings"]
+            )
+            self._index.add(
+                stored_embeddings["ids"],
+                np.asarray(stored_embeddings["embeddings"], dtype=np.float32),
+            )
+
+        # fetch metadata only for stored tools that were not just imported from
+        # files; the document holds the definition
+        unknown_ids = [id_ for id_ in stored_ids if id_ not in self.tools]
+        if unknown_ids:
+            stored_tools = self._collection.get(
+                ids=unknown_ids, include=["metadatas", "documents"]
+            )
+            for metadata, document in zip(
+                stored_tools["metadatas"], stored_tools["documents"]
+            ):
+                tool = Tool(
+                    function_name=metadata["function_name"],
+                    module_name=metadata["module_name"],
+                    definition=_loads(document),
+                    timeout=metadata["timeout"],
+                    timeout_message=metadata["timeout_message"],
+                    predecessor=(
+                        metadata["predecessor"] if "predecessor" in metadata else None
+                    ),
+                    successor=(
+                        metadata["successor"] if "successor" in metadata else None
+                    ),
                 )
-                for tool in new_tools.values()
-            ],
-            metadatas=[tool.format_for_chroma() for tool in new_tools.values()],
-            ids=list(new_tools.keys()),
+                self.tools[tool.unique_id] = tool
+
+        # load new functions into vector store
+        stored = set(stored_ids)
+        self._add_tools(
+            [tool for tool_id, tool in self.tools.items() if tool_id not in stored]
         )
 
-    def _add_function(
+    def _embed(self, text: str) -> list[float]:
+        return self._embed_many(texts=[text])[0].tolist()
+
+    def _embed_query(self, text: str) -> list[float]:
+        """Embed a search query, serving repeats from an in-memory LRU cache."""
+        # queries that only differ in surrounding or repeated whitespace
+        # share one cache entry and one embedding
+        text = " ".join(text.split())
+        with self._cache_lock:
+            embedding = self._query_embedding_cache.get(text)
+            if embedding is not None:
+                self._query_embedding_cache.move_to_end(text)
+                return embedding
+        embedding = self._embed(text=text)
+        with self._cache_lock:
+            self._query_embedding_cache[text] = embedding
+            if len(self._query_embedding_cache) > QUERY_EMBEDDING_CACHE_SIZE:
+                self._query_embedding_cache.popitem(last=False)
+        return embedding
+
+    def _embed_many(self, texts: list[str]) -> np.ndarray:
+        known = self.embed_cache.get_many(texts)
+        new_texts = [text for text in texts if text not in known]
+        if new_texts:
+            new_embeddings = dict(
+                zip(
+                    new_texts,
+                    embed_batch(
+                        texts=new_texts,
+                        embedding_client=self.embedding_client,
+                        embedding_model=self.embedding_model,
+                    ),
+                )
+            )
+            self.embed_cache.put_many(new_embeddings)
+            known.update(new_embeddings)
+        embeddings = np.asarray([known[text] for text in texts], dtype=np.float32)
+        if self.quantize_embeddings:
+            embeddings = quantize_embedding(embeddings)
+        return embeddings
+
+    def _analyze_functions(
+        self, module_name: str, functions: list[Callable]
+    ) -> list[dict]:
+        """Analyze functions; for larger modules the analyses run in parallel."""
+        if len(functions) >= PARALLEL_ANALYSIS_THRESHOLD:
+            try:
+                with ProcessPoolExecutor() as executor:
+                    return list(
+                        executor.map(
+                            _analyze_function,
+                            [
+                                (module_name, function.__name__)
+                                for function in functions
+                            ],
+                        )
+                    )
+            except Exception as e:
+                logger.warning(
+                    f"Parallel function analysis failed, analyzing serially: "
+                    f"{type(e).__name__}: {e}"
+                )
+        return [
+            self.function_analyzer.analyze_function(function) for function in functions
+        ]
+
+    def _make_tool(
         self,
         function: Callable,
         module_name: str,
         timeout: Optional[int] = None,
         timeout_message: Optional[str] = None,
+        definition: Optional[dict] = None,
     ) -> Tool:
-        function_definition = self.function_analyzer.analyze_function(function)
-        tool = Tool(
+        function_definition = (
+            definition
+            if definition is not None
+            else self.function_analyzer.analyze_function(function)
+        )
+        return Tool(
             function_name=function.__name__,
             module_name=module_name,
             definition=function_definition,
@@ -192,20 +450,47 @@ class ToolLibrary:
                 else self.default_timeout_message
             ),
         )
-        self.tools[tool.unique_id] = tool
+
+    def _add_tools(self, tools: list[Tool]) -> None:
+        """Insert tools with a single batched embedding call and a single add."""
+        if not tools:
+            return
+        # load the store before registering the tools; otherwise the loader,
+        # triggered below via the collection property, would see them as
+        # unsynced and insert them a second time
+        self._ensure_store_loaded()
+        ids, documents, descriptions, metadatas = [], [], [], []
+        for tool in tools:
+            self.tools[tool.unique_id] = tool
+            ids.append(tool.unique_id)
+            documents.append(_dumps(tool.definition))
+            descriptions.append(tool.description)
+            metadatas.append(tool.format_for_chroma())
+        embeddings = self._embed_many(texts=descriptions)
         self.collection.add(
-            documents=[json.dumps(tool.definition, indent=4)],
-            embeddings=[
-                embed(
-                    text=tool.description,
-                    embedding_client=self.embedding_client,
-                    embedding_model=self.embedding_model,
-                )
-            ],
-            metadatas=[tool.format_for_chroma()],
-            ids=[tool.unique_id],
+            documents=documents,
+            embeddings=embeddings,
+            metadatas=metadatas,
+            ids=ids,
+        )
+        if self._index is not None:
+            self._index.add(ids, embeddings)
+        logger.info(f"Added tools {ids} to collection {self.collection}.")
+
+    def _add_function(
+        self,
+        function: Callable,
+        module_name: str,
+        timeout: Optional[int] = None,
+        timeout_message: Optional[str] = None,
+    ) -> Tool:
+        tool = self._make_tool(
+            function=function,
+            module_name=module_name,
+            timeout=timeout,
+            timeout_message=timeout_message,
         )
-        logger.info(f"Added function {tool.unique_id} to collection {self.collection}.")
+        self._add_tools([tool])
         return tool
 
     def load_functions_from_file(
@@ -219,24 +504,22 @@ class ToolLibrary:
             module = importlib.reload(sys.modules[module_name])
         else:
             module = importlib.import_module(module_name)
-        functions = [
-            f
-            for n, f in getmembers(module, isfunction)
-            if f.__module__ == module_name
-            and (not function_names or n in function_names)
-        ]
+        functions = _module_functions(module, module_name, function_names)
+        definitions = self._analyze_functions(module_name, functions)
         tools = []
-        for function in functions:
+        for function, definition in zip(functions, definitions):
             tool_id = f"{module_name}__{function.__name__}"
             timeout_settings_ = (
                 timeout_settings[tool_id] if tool_id in timeout_settings else {}
             )
-            tool = self._add_function(
+            tool = self._make_tool(
                 function=function,
                 module_name=module_name,
+                definition=definition,
                 **timeout_settings_,
             )
             tools.append(tool)
+        self._add_tools(tools)
         return tools
 
     def remove_tool(
@@ -244,7 +527,10 @@ class ToolLibrary:
         tool_id: str,
     ) -> None:
         self.collection.delete(ids=[tool_id])
+        if self._index is not None:
+            self._index.remove(tool_id)
         self.tools.pop(tool_id)
+        self._invalidate_execution_cache(tool_id)
         logger.info(f"Removed tool {tool_id} from collection {self.collection}.")
 
     def update_tool(
@@ -253,6 +539,9 @@ class ToolLibrary:
         timeout: Optional[int] = None,
         timeout_message: Optional[str] = None,
     ) -> Tool:
+        if tool_id not in self.tools and self._collection is None:
+            # the tool may only exist in the not yet loaded store
+            self._ensure_store_loaded()
         old_tool = self.tools[tool_id]
         module_name = old_tool.module_name
         timeout = timeout or old_tool.timeout
@@ -270,13 +559,31 @@ class ToolLibrary:
         module = importlib.reload(old_tool.module)
         function = getattr(module, old_tool.function_name)
 
-        self.remove_tool(tool_id)
-        tool = self._add_function(
+        tool = self._make_tool(
             function=function,
             module_name=module.__name__,
             timeout=timeout,
             timeout_message=timeout_message,
         )
+        self.tools[tool_id] = tool
+        update_data = {
+            "ids": [tool_id],
+            "documents": [_dumps(tool.definition)],
+            "metadatas": [tool.format_for_chroma()],
+        }
+        if tool.description != old_tool.description:
+            # only changed descriptions require a new embedding
+            update_data["embeddings"] = [self._embed(text=tool.description)]
+            if self._index is not None:
+                self._index.update(
+                    tool_id, np.asarray(update_data["embeddings"][0], dtype=np.float32)
+                )
+        else:
+            stored = self.collection.get(ids=[tool_id], include=["embeddings"])
+            update_data["embeddings"] = [stored["embeddings"][0]]
+        self.collection.update(**update_data)
+        self._invalidate_execution_cache(tool_id)
+        logger.info(f"Updated tool {tool_id} in collection {self.collection}.")
         return tool
 
     def search(
@@ -285,37 +592,114 @@ class ToolLibrary:
         top_k: int = 1,
         similarity_threshold: float = None,
     ) -> list[Tool]:
+        # the full tool set is only known once the store is loaded
+        self._ensure_store_loaded()
         if top_k >= len(self.tools) and similarity_threshold is None:
             res = self.tools.values()
         else:
-            query_embedding = embed(
-                text=problem_description,
-                embedding_client=self.embedding_client,
-                embedding_model=self.embedding_model,
+            query_embedding = self._embed_query(text=problem_description)
+            if self._index is not None:
+                ids, distances = self._index.query(
+                    np.asarray(query_embedding, dtype=np.float32), top_k
+                )
+            else:
+                res = self.collection.query(
+                    query_embeddings=[query_embedding],
+                    n_results=top_k,
+                    include=["distances"],
+                )
+                ids, distances = res["ids"][0], res["distances"][0]
+            # distances are sorted ascending, so the cutoff can be bisected
+            cutoff = (
+                bisect_left(distances, similarity_threshold)
+                if similarity_threshold
+                else top_k
             )
+            res = [self.tools[tool_id] for tool_id in ids[:cutoff]]
+        return res
+
+    def search_many(
+        self,
+        problem_descriptions: list[str],
+        top_k: int = 1,
+        similarity_threshold: float = None,
+    ) -> list[list[Tool]]:
+        """
+        Search tools for several problem descriptions at once: the
+        descriptions are embedded in a single batch request and queried
+        against the store in one call instead of one round-trip each.
+        """
+        self._ensure_store_loaded()
+        if top_k >= len(self.tools) and similarity_threshold is None:
+            return [list(self.tools.values()) for _ in problem_descriptions]
+        unique_descriptions = list(dict.fromkeys(problem_descriptions))
+        # normalize whitespace as in _embed_query so repeats share cache entries
+        query_embeddings = self._embed_many(
+            texts=[" ".join(description.split()) for description in unique_descriptions]
+        )
+        if self._index is not None:
+            matches = [
+                self._index.query(query_embedding, top_k)
+                for query_embedding in query_embeddings
+            ]
+        else:
             res = self.collection.query(
-                query_embeddings=[query_embedding],
+                query_embeddings=query_embeddings.tolist(),
                 n_results=top_k,
                 include=["distances"],
             )
-            cutoff = top_k
-            if similarity_threshold:
-                for c, distance in enumerate(res["distances"][0]):
-                    if distance >= similarity_threshold:
-                        cutoff = c
-                        break
-            res = [self.tools[tool_id] for tool_id in res["ids"][0][:cutoff]]
-        return res
+            matches = list(zip(res["ids"], res["distances"]))
+        tools_by_description = {}
+        for description, (ids, distances) in zip(unique_descriptions, matches):
+            cutoff = (
+                bisect_left(distances, similarity_threshold)
+                if similarity_threshold
+                else top_k
+            )
+            tools_by_description[description] = [
+                self.tools[tool_id] for tool_id in ids[:cutoff]
+            ]
+        return [
+            tools_by_description[description] for description in problem_descriptions
+        ]
+
+    def _invalidate_execution_cache(self, tool_id: str) -> None:
+        with self._cache_lock:
+            for key in [k for k in self._execution_cache if k[0] == tool_id]:
+                del self._execution_cache[key]
 
     def execute(
         self,
         tool_id: str,
         arguments: dict,
     ) -> tuple:
-        if tool_id not in self.tools:
+        tool = self.tools.get(tool_id)
+        if tool is None and self._collection is None:
+            # the tool may only exist in the not yet loaded store
+            self._ensure_store_loaded()
+            tool = self.tools.get(tool_id)
+        if tool is None:
             return (
                 f"Error: {tool_id} is not a valid tool. Use only the tools available.",
                 True,
             )
-        tool = self.tools[tool_id]
-        return tool.execute(**arguments)
+        cache_key = None
+        if tool_id in self.memoized_tools:
+            # canonicalize by key order so equivalent calls share an entry
+            cache_key = (
+                tool_id,
+                _dumps({k: arguments[k] for k in sorted(arguments)}),
+            )
+            with self._cache_lock:
+                cached = self._execution_cache.get(cache_key)
+                if cached is not None:
+                    self._execution_cache.move_to_end(cache_key)
+                    return cached
+        result = tool.execute() if not arguments else tool.execute(**arguments)
+        if cache_key is not None and not result[1]:
+            # only successful results are worth replaying
+            with self._cache_lock:
+                self._execution_cache[cache_key] = result
+                if len(self._execution_cache) > EXECUTION_CACHE_SIZE:
+                    self._execution_cache.popitem(last=False)
+        return result
@@ -142,6 +142,17 @@ class TestFunctionAnalyzer(unittest.TestCase):
             "Resolving nested parameter types failed.",
         )
 
+    def test_cached_analysis_is_independent(self):
+        first = self.fa.analyze_function(dummy_function)
+        second = self.fa.analyze_function(dummy_function)
+        self.assertEqual(first, second, "Cached analysis differs from original.")
+        second["function"]["name"] = "renamed"
+        self.assertEqual(
+            self.fa.analyze_function(dummy_function)["function"]["name"],
+            "dummy_function",
+            "Mutating an analysis result must not affect the cache.",
+        )
+
     def test_parameter_description(self):
         res = self.fa.analyze_function(nested_function)
         self.assertEqual(
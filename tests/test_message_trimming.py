@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+#
+# Copyright (c) 2024, Honda Research Institute Europe GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+"""
+Offline tests for the token-budget message trimming; the encoding is stubbed
+so that no API key or network access is required.
+"""
+import os
+import unittest
+from unittest import mock
+
+os.environ.setdefault("OPENAI_API_KEY", "offline-test")
+
+from tulip_agent import BaseAgent  # noqa: E402
+
+
+class FakeEncoding:
+    """One token per whitespace-separated word."""
+
+    def encode(self, text: str) -> list[int]:
+        return [0] * len(text.split())
+
+
+def message(role: str, words: int, **extra) -> dict:
+    return {"role": role, "content": " ".join(["word"] * words), **extra}
+
+
+@mock.patch(
+    "tulip_agent.agents.llm_agent._encoding_for_model",
+    new=lambda model: FakeEncoding(),
+)
+class TestTrimMessages(unittest.TestCase):
+    def setUp(self):
+        self.agent = BaseAgent(token_budget=30)
+
+    def test_no_trimming_within_budget(self):
+        msgs = [message("system", 1), message("user", 1), message("assistant", 1)]
+        self.assertEqual(
+            self.agent._trim_messages(msgs),
+            msgs,
+            "Messages within the budget were trimmed.",
+        )
+
+    def test_window_keeps_system_and_recent_messages(self):
+        # each message costs its word count plus a framing offset of 4
+        msgs = [message("system", 2)] + [message("user", 6) for _ in range(5)]
+        trimmed = self.agent._trim_messages(msgs)
+        self.assertEqual(
+            trimmed,
+            [msgs[0]] + msgs[4:],
+            "Trimming did not keep the system message and the most recent messages.",
+        )
+
+    def test_last_message_always_kept(self):
+        msgs = [message("system", 2), message("user", 100)]
+        self.assertEqual(
+            self.agent._trim_messages(msgs),
+            msgs,
+            "Trimming dropped the latest message.",
+        )
+
+    def test_trailing_tool_results_keep_their_tool_call(self):
+        msgs = [
+            message("system", 2),
+            message("assistant", 20, tool_calls=[{"id": "call_1"}]),
+            message("tool", 1, tool_call_id="call_1", name="add"),
+        ]
+        self.assertEqual(
+            self.agent._trim_messages(msgs),
+            msgs,
+            "Trimming stranded a trailing tool result without its tool call.",
+        )
+
+    def test_trailing_tool_block_kept_over_budget(self):
+        msgs = [
+            message("system", 2),
+            message("user", 6),
+            message("assistant", 10, tool_calls=[{"id": "call_1"}, {"id": "call_2"}]),
+            message("tool", 10, tool_call_id="call_1", name="add"),
+            message("tool", 10, tool_call_id="call_2", name="add"),
+        ]
+        self.assertEqual(
+            self.agent._trim_messages(msgs),
+            [msgs[0]] + msgs[2:],
+            "Trimming split up the trailing tool-call and tool-result block.",
+        )
+
+    def test_orphaned_tool_messages_dropped(self):
+        msgs = [
+            message("system", 2),
+            message("user", 20),
+            message("assistant", 1),
+            message("tool", 1, tool_call_id="call_1", name="add"),
+            message("tool", 1, tool_call_id="call_2", name="add"),
+            message("user", 6),
+        ]
+        trimmed = self.agent._trim_messages(msgs)
+        self.assertEqual(
+            trimmed,
+            [msgs[0], msgs[-1]],
+            "Trimming left tool results without their originating tool call.",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
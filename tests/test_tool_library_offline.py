@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+#
+# Copyright (c) 2024, Honda Research Institute Europe GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+"""
+Offline tool library tests; embeddings are stubbed with deterministic vectors
+so that no API key or network access is required.
+"""
+import hashlib
+import os
+import sys
+import tempfile
+import textwrap
+import unittest
+from unittest import mock
+
+import numpy as np
+
+os.environ.setdefault("OPENAI_API_KEY", "offline-test")
+
+from tulip_agent.tool_library import ToolLibrary  # noqa: E402
+
+
+def fake_embed_batch(texts, embedding_client=None, embedding_model=None):
+    """Deterministic unit vectors derived from the text, no API calls."""
+    embeddings = []
+    for text in texts:
+        seed = int.from_bytes(hashlib.md5(text.encode()).digest()[:4], "big")
+        vector = np.random.default_rng(seed).normal(size=32)
+        embeddings.append((vector / np.linalg.norm(vector)).tolist())
+    return embeddings
+
+
+@mock.patch("tulip_agent.tool_library.embed_batch", new=fake_embed_batch)
+class TestExactSearchParity(unittest.TestCase):
+    def setUp(self):
+        self.base_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.base_dir.cleanup)
+
+    def make_library(self, sub_dir: str, **kwargs) -> ToolLibrary:
+        return ToolLibrary(
+            chroma_base_dir=self.base_dir.name + "/",
+            chroma_sub_dir=sub_dir,
+            file_imports=[("example_tools", [])],
+            **kwargs,
+        )
+
+    def test_search_parity(self):
+        exact = self.make_library("exact/", exact_search=True)
+        chroma = self.make_library("chroma/", exact_search=False)
+        for query in ("add 4 and 5", "subtract two numbers", "multiply values"):
+            self.assertEqual(
+                [t.unique_id for t in exact.search(query, top_k=2)],
+                [t.unique_id for t in chroma.search(query, top_k=2)],
+                f"Exact and Chroma search disagree for `{query}`.",
+            )
+
+    def test_search_parity_with_threshold(self):
+        exact = self.make_library("exact/", exact_search=True)
+        chroma = self.make_library("chroma/", exact_search=False)
+        self.assertEqual(
+            [
+                t.unique_id
+                for t in exact.search("add 4 and 5", top_k=3, similarity_threshold=1.5)
+            ],
+            [
+                t.unique_id
+                for t in chroma.search("add 4 and 5", top_k=3, similarity_threshold=1.5)
+            ],
+            "Exact and Chroma search disagree with a similarity threshold.",
+        )
+
+
+@mock.patch("tulip_agent.tool_library.embed_batch", new=fake_embed_batch)
+class TestExecutionMemoization(unittest.TestCase):
+    def setUp(self):
+        self.base_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.base_dir.cleanup)
+        self.tulip = ToolLibrary(
+            chroma_base_dir=self.base_dir.name + "/",
+            chroma_sub_dir="memo/",
+            file_imports=[("example_tools", [])],
+            exact_search=True,
+            memoized_tools=["example_tools__add"],
+        )
+
+    def test_cache_hit(self):
+        result = self.tulip.execute("example_tools__add", {"a": 1, "b": 2})
+        self.assertEqual(result, (3, False), "Executing a memoized tool failed.")
+        (cache_key,) = self.tulip._execution_cache
+        # replace the cached entry; a second call must return it verbatim
+        self.tulip._execution_cache[cache_key] = ("sentinel", False)
+        self.assertEqual(
+            self.tulip.execute("example_tools__add", {"b": 2, "a": 1}),
+            ("sentinel", False),
+            "Repeated execution of a memoized tool did not hit the cache.",
+        )
+
+    def test_unmemoized_tool_not_cached(self):
+        self.tulip.execute("example_tools__subtract", {"a": 3, "b": 1})
+        self.assertEqual(
+            len(self.tulip._execution_cache),
+            0,
+            "Execution of an unmemoized tool was cached.",
+        )
+
+    def test_invalidation_on_remove(self):
+        self.tulip.execute("example_tools__add", {"a": 1, "b": 2})
+        self.assertEqual(len(self.tulip._execution_cache), 1)
+        self.tulip.remove_tool("example_tools__add")
+        self.assertEqual(
+            len(self.tulip._execution_cache),
+            0,
+            "Removing a tool did not invalidate its cached executions.",
+        )
+
+    def test_invalidation_on_update(self):
+        module_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(module_dir.cleanup)
+        sys.path.insert(0, module_dir.name)
+        self.addCleanup(sys.path.remove, module_dir.name)
+        with open(os.path.join(module_dir.name, "memo_tool.py"), "w") as f:
+            f.write(
+                textwrap.dedent(
+                    '''
+                    def double(x: int) -> int:
+                        """
+                        Double a number.
+
+                        :param x: The number.
+                        :return: Twice the number.
+                        """
+                        return 2 * x
+                    '''
+                )
+            )
+        self.tulip.load_functions_from_file(module_name="memo_tool")
+        self.tulip.memoized_tools.add("memo_tool__double")
+        self.assertEqual(self.tulip.execute("memo_tool__double", {"x": 2}), (4, False))
+        self.assertEqual(len(self.tulip._execution_cache), 1)
+        self.tulip.update_tool(tool_id="memo_tool__double")
+        self.assertEqual(
+            len(self.tulip._execution_cache),
+            0,
+            "Updating a tool did not invalidate its cached executions.",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()